@@ -8,8 +8,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
+import warnings
 
 import click
 from click_default_group import DefaultGroup
@@ -19,6 +21,22 @@ from sdsstools.daemonizer import DaemonGroup
 
 from hal import __version__, config
 from hal.actor import HALActor
+from hal.exceptions import HALUserWarning
+
+
+def use_uvloop():
+    """Sets uvloop as the event loop policy, if it is installed."""
+
+    try:
+        import uvloop
+    except ImportError:
+        warnings.warn(
+            "uvloop is not installed. Using the default event loop.",
+            HALUserWarning,
+        )
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 @click.group(
@@ -60,6 +78,10 @@ def hal(
         click.echo(__version__)
         sys.exit(0)
 
+    # This needs to happen before the actor creates its event loop.
+    if config.get("use_uvloop", False):
+        use_uvloop()
+
 
 @hal.group(cls=DaemonGroup, prog="hal-actor", workdir=os.getcwd())
 @click.pass_context
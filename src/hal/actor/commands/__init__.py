@@ -79,8 +79,9 @@ def stages(macro_name: str, reset: bool = True):
                 return command.finish()
 
             if stages is not None:
+                valid_stages = set(flatten(macro.__STAGES__ + macro.__CLEANUP__))
                 for stage in stages:
-                    if stage not in flatten(macro.__STAGES__ + macro.__CLEANUP__):
+                    if stage not in valid_stages:
                         raise click.BadArgumentUsage(f"Invalid stage {stage}")
 
             if reset:
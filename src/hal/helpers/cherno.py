@@ -51,9 +51,21 @@ class ChernoHelper(HALHelper):
 
         self.status = GuiderStatus.UNKNOWN
 
+        # Keeps references to the non-blocking acquire/guide commands until done.
+        self._tasks: set[asyncio.Task] = set()
+
         self.model = actor.models["cherno"]
         self.model["guider_status"].register_callback(self._guider_status)
 
+    def _track(self, coro) -> asyncio.Task:
+        """Runs a coroutine as a task and keeps a reference until it is done."""
+
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return task
+
     async def _guider_status(self, key: TronKey):
         """Updates the internal guider status."""
 
@@ -160,7 +172,7 @@ class ChernoHelper(HALHelper):
         if block:
             await self._send_command(command, "cherno", command_str)
         else:
-            asyncio.create_task(self._send_command(command, "cherno", command_str))
+            self._track(self._send_command(command, "cherno", command_str))
 
         return
 
@@ -211,7 +223,7 @@ class ChernoHelper(HALHelper):
         if wait:
             await coro
         else:
-            asyncio.shield(asyncio.create_task(coro))
+            asyncio.shield(self._track(coro))
 
     async def stop_guiding(self, command: HALCommandType):
         """Stops the guide loop."""
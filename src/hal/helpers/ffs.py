@@ -35,20 +35,31 @@ class FFSHelper(HALHelper):
         """Returns the FFS status flags."""
 
         values = self.actor.models["mcp"]["ffsStatus"].value
-        if len(values) == 0 or all([value is None for value in values]):
+        if len(values) == 0 or all(value is None for value in values):
             return [FFSStatus.UNKNWON] * 8
 
-        return [FFSStatus(value) for value in values]
+        return [_FFS_LOOKUP.get(value) or FFSStatus(value) for value in values]
+
+    def _all_petals(self, status: FFSStatus):
+        """Returns `True` if all the petals have a given status.
+
+        Compares the raw keyword values, without building the status flags.
+
+        """
+
+        values = self.actor.models["mcp"]["ffsStatus"].value
+
+        return len(values) > 0 and all(value == status.value for value in values)
 
     def all_closed(self):
         """Returns `True` if all the petals are closed."""
 
-        return all([x == FFSStatus.CLOSED for x in self.get_values()])
+        return self._all_petals(FFSStatus.CLOSED)
 
     def all_open(self):
         """Returns `True` if all the petals are open."""
 
-        return all([x == FFSStatus.OPEN for x in self.get_values()])
+        return self._all_petals(FFSStatus.OPEN)
 
     async def open(self, command: HALCommandType):
         """Open all the petals."""
@@ -74,3 +85,7 @@ class FFSStatus(enum.Enum):
     CLOSED = "01"
     OPEN = "10"
     INVALID = "11"
+
+
+# Maps the raw keyword values to status flags.
+_FFS_LOOKUP = {status.value: status for status in FFSStatus}
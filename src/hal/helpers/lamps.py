@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import time
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from hal import config
 from hal.exceptions import HALError
@@ -20,7 +20,7 @@ from . import HALHelper
 
 
 if TYPE_CHECKING:
-    from hal.actor import HALCommandType
+    from hal.actor import HALActor, HALCommandType
 
 
 __all__ = ["LampsHelperAPO", "LampsHelperLCO"]
@@ -31,9 +31,27 @@ class LampsHelperAPO(HALHelper):
 
     LAMPS = ["ff", "HgCd", "Ne"]
     WARMUP = config["lamp_warmup"].copy()
+    TIMEOUT: float = config["timeouts"]["lamps"]
 
     name = "lamps"
 
+    def __init__(self, actor: HALActor):
+        super().__init__(actor)
+
+        # Commanded state, actual state, and last-seen time of each lamp as read
+        # from the mcp model. Invalidated when any of the lamp keywords changes.
+        self._lamp_keys: dict[str, tuple[bool, bool, float | None]] | None = None
+
+        mcp_model = actor.models["mcp"]
+        for lamp in self.LAMPS:
+            mcp_model[f"{lamp}LampCommandedOn"].register_callback(self._lamp_updated)
+            mcp_model[f"{lamp}Lamp"].register_callback(self._lamp_updated)
+
+    async def _lamp_updated(self, key):
+        """Invalidates the cached lamp keywords when one of them is updated."""
+
+        self._lamp_keys = None
+
     def _command_one(self, command: HALCommandType, lamp: str, state: bool):
         """Commands one lamp."""
 
@@ -43,7 +61,7 @@ class LampsHelperAPO(HALHelper):
             command,
             "mcp",
             f"{lamp.lower()}_{state_str}",
-            time_limit=config["timeouts"]["lamps"],
+            time_limit=self.TIMEOUT,
         )
 
     async def all_off(self, command: HALCommandType, force: bool = False):
@@ -51,13 +69,14 @@ class LampsHelperAPO(HALHelper):
 
         status = self.list_status()
 
-        tasks = []
+        lamps = []
         for lamp in self.LAMPS:
             if force is False and status[lamp][0] is False and status[lamp][-1] is True:
                 continue
-            tasks.append(self.turn_lamp(command, lamp, False, force=force))
+            lamps.append(lamp)
 
-        await asyncio.gather(*tasks)
+        if len(lamps) > 0:
+            await self.turn_lamp(command, lamps, False, force=force)
 
     def list_status(self) -> dict[str, tuple[bool, bool, float, bool]]:
         """Returns a dictionary with the state of the lamps.
@@ -69,19 +88,41 @@ class LampsHelperAPO(HALHelper):
 
         """
 
+        lamp_keys = self._lamp_keys
+        if lamp_keys is None:
+            lamp_keys = self._lamp_keys = self._read_lamp_keys()
+
+        now = time.time()
+
         state = {}
+        for lamp, (commanded_on, lamp_state, last_seen) in lamp_keys.items():
+            if last_seen is None:
+                state[lamp] = (commanded_on, lamp_state, 0.0, lamp_state)
+            else:
+                elapsed = now - last_seen
+                warmed = (elapsed >= self.WARMUP[lamp]) if commanded_on else False
+                state[lamp] = (commanded_on, lamp_state, elapsed, warmed)
+
+        return state
+
+    def _read_lamp_keys(self):
+        """Reads the lamp keywords from the mcp model."""
+
+        mcp_model = self.actor.models["mcp"]
+
+        lamp_keys = {}
         for lamp in self.LAMPS:
             commanded_key = f"{lamp}LampCommandedOn"
-            commanded_on = self.actor.models["mcp"][commanded_key][0]
+            commanded_on = mcp_model[commanded_key][0]
             if commanded_on is None:
                 raise HALError(f"Failed getting {commanded_key}.")
             if lamp in ["wht", "UV"]:
                 is_on = bool(commanded_on)
-                state[lamp] = (is_on, is_on, 0.0, is_on)
+                lamp_keys[lamp] = (is_on, is_on, None)
             else:
                 lamp_key = f"{lamp}Lamp"
-                lamp_state = self.actor.models["mcp"][lamp_key]
-                if any([lv is None for lv in lamp_state]):
+                lamp_state = mcp_model[lamp_key]
+                if any(lv is None for lv in lamp_state):
                     raise HALError(f"Failed getting {lamp_key}.")
                 last_seen = lamp_state.last_seen
                 if sum(lamp_state.value) == 4:
@@ -89,20 +130,65 @@ class LampsHelperAPO(HALHelper):
                 else:  # Sometimes when a lamp is turning on we'll have, e.g., 1,0,0,1.
                     lamp_state = False
 
-                elapsed = time.time() - last_seen
-                warmed = (elapsed >= self.WARMUP[lamp]) if bool(commanded_on) else False
-                state[lamp] = (bool(commanded_on), lamp_state, elapsed, warmed)
+                lamp_keys[lamp] = (bool(commanded_on), lamp_state, last_seen)
 
-        return state
+        return lamp_keys
+
+    async def wait_for_warmup(
+        self,
+        lamps: str | list[str],
+        timeout: float,
+        warmup: dict[str, float] | None = None,
+    ) -> bool:
+        """Blocks until the lamps are on and warmed up, or until ``timeout``.
+
+        Parameters
+        ----------
+        lamps
+            Name of the lamp(s) to wait for.
+        timeout
+            Maximum number of seconds to wait.
+        warmup
+            A mapping of lamp name to the number of seconds the lamp must have
+            been on to be considered warmed up. Defaults to `.WARMUP`.
+
+        Returns
+        -------
+        warmed
+            `True` if all the lamps are warmed up, `False` if the timeout was
+            reached first.
+
+        """
+
+        if isinstance(lamps, str):
+            lamps = [lamps]
+
+        if warmup is None:
+            warmup = self.WARMUP
+
+        start = time.time()
+        while True:
+            status = self.list_status()
+            if all(
+                status[lamp][1] and status[lamp][2] >= warmup[lamp] for lamp in lamps
+            ):
+                return True
+
+            remaining = timeout - (time.time() - start)
+            if remaining <= 0:
+                return False
+
+            await asyncio.sleep(min(remaining, 1))
 
     async def turn_lamp(
         self,
         command: HALCommandType,
-        lamps: str | list[str],
+        lamps: str | Sequence[str],
         state: bool,
         turn_off_others: bool = False,
         delay: float = 0.0,
         force: bool = False,
+        ready_after: float | None = None,
     ):
         """Turns a lamp on or off.
 
@@ -123,6 +209,9 @@ class LampsHelperAPO(HALHelper):
             Wait this amount of seconds before actually commanding the lamps.
         force
             If `True`, send the on/off command regardless of status.
+        ready_after
+            A `time.monotonic` reference from which ``delay`` is measured. If
+            `None`, the delay starts when the coroutine runs.
 
         """
 
@@ -133,7 +222,11 @@ class LampsHelperAPO(HALHelper):
             if lamp not in self.LAMPS:
                 raise HALError(f"Invalid lamp {lamp}.")
 
-        await asyncio.sleep(delay)
+        wait = delay
+        if ready_after is not None:
+            wait -= time.monotonic() - ready_after
+
+        await asyncio.sleep(max(wait, 0))
 
         status = self.list_status()
 
@@ -247,7 +340,7 @@ class LampsHelperLCO(HALHelper):
     async def turn_lamp(
         self,
         command: HALCommandType,
-        lamps: str | list[str],
+        lamps: str | Sequence[str],
         state: bool,
         turn_off_others: bool = False,
         delay: float = 0.0,
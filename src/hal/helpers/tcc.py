@@ -8,6 +8,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 from typing import TYPE_CHECKING
 
 from hal import config
@@ -26,6 +29,8 @@ __all__ = ["TCCHelper"]
 class TCCHelper(HALHelper):
     """Helper for the TCC."""
 
+    SLEW_TIMEOUT: float = config["timeouts"]["slew"]
+
     name = "tcc"
 
     is_slewing: bool = False
@@ -235,11 +240,41 @@ class TCCHelper(HALHelper):
         limit = self.actor.config["goto"]["alt_limit"]
         return self.actor.models["tcc"]["axePos"][1] < limit
 
-    def check_axes_status(self, status: str) -> bool:
-        """Returns `True` if all the axes are at ``status``."""
+    def check_axes_status(
+        self,
+        status: str,
+        axes: tuple[str, ...] = ("az", "alt", "rot"),
+    ) -> bool:
+        """Returns `True` if all the ``axes`` are at ``status``."""
+
+        status = status.lower()
 
         axes_status = self.actor.models["tcc"]["AxisCmdState"].value
-        return all([axis.lower() == status.lower() for axis in axes_status])
+        if axes != ("az", "alt", "rot"):
+            axes_status = [axes_status[("az", "alt", "rot").index(ax)] for ax in axes]
+
+        return all(axis is not None and axis.lower() == status for axis in axes_status)
+
+    async def wait_for_axes_status(self, status: str, timeout: float) -> bool:
+        """Blocks until all the axes are at ``status`` or until ``timeout``.
+
+        Returns `True` as soon as the ``AxisCmdState`` keyword reports all the
+        axes at ``status``, or `False` if the timeout is reached first.
+
+        """
+
+        start = time.time()
+        while True:
+            axes_status = self.actor.models["tcc"]["AxisCmdState"].value
+            if len(axes_status) > 0 and None not in axes_status:
+                if self.check_axes_status(status):
+                    return True
+
+            remaining = timeout - (time.time() - start)
+            if remaining <= 0:
+                return False
+
+            await asyncio.sleep(min(remaining, 0.5))
 
     async def do_slew(
         self,
@@ -290,7 +325,7 @@ class TCCHelper(HALHelper):
                 command,
                 "tcc",
                 track_command,
-                time_limit=config["timeouts"]["slew"],
+                time_limit=self.SLEW_TIMEOUT,
                 raise_on_fail=False,
             )
         else:
@@ -315,7 +350,7 @@ class TCCHelper(HALHelper):
                         "tcc",
                         f"track {ra}, {dec} icrs /rottype=object/rotang={rot:g} "
                         f"{rotwrap} {keep_args}",
-                        time_limit=config["timeouts"]["slew"],
+                        time_limit=self.SLEW_TIMEOUT,
                         raise_on_fail=False,
                     )
 
@@ -334,7 +369,7 @@ class TCCHelper(HALHelper):
                         "tcc",
                         f"track {az:f}, {alt:f} mount /rottype=mount "
                         f"/rotangle={rot:f} {rotwrap} {keep_args}",
-                        time_limit=config["timeouts"]["slew"],
+                        time_limit=self.SLEW_TIMEOUT,
                         raise_on_fail=False,
                     )
 
@@ -356,7 +391,7 @@ class TCCHelper(HALHelper):
                     command,
                     "tcc",
                     f"offset guide {az / 3600.0:g},{alt / 3600.0:g},{rot / 3600.0:g} /computed",
-                    time_limit=config["timeouts"]["slew"],
+                    time_limit=self.SLEW_TIMEOUT,
                     raise_on_fail=False,
                 )
 
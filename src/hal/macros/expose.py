@@ -110,10 +110,10 @@ class ExposeHelper:
 
         self.params.__dict__.update(**valid_opts)
 
-        if "expose_boss" not in self.macro.flat_stages:
+        if "expose_boss" not in self.macro.stages_set:
             self.params.count_boss = None
             self.params.readout_matching = False
-        elif "expose_apogee" not in self.macro.flat_stages:
+        elif "expose_apogee" not in self.macro.stages_set:
             self.params.count_apogee = None
 
         return self.params
@@ -455,8 +455,10 @@ class ExposeMacro(Macro):
 
         self.command.debug(expose_is_paused=False)
 
-        do_apogee = "expose_apogee" in self.flat_stages
-        do_boss = "expose_boss" in self.flat_stages
+        stages = self._stages_set
+
+        do_apogee = "expose_apogee" in stages
+        do_boss = "expose_boss" in stages
 
         # First check if we are exposing and if we are fail before doing anything else.
         if do_apogee and self.helpers.apogee.is_exposing():
@@ -595,7 +597,7 @@ class ExposeMacro(Macro):
         await self.expose_helper.stop()
 
         # Close the APOGEE cold shutter.
-        if "expose_apogee" in self.flat_stages:
+        if "expose_apogee" in self._stages_set:
             self.command.info("Closing APOGEE shutter.")
             await self.helpers.apogee.shutter(
                 self.command,
@@ -606,7 +608,7 @@ class ExposeMacro(Macro):
             if self.helpers.apogee.is_exposing():
                 self.command.warning("APOGEE exposure is running. Not cancelling it.")
 
-        if "expose_boss" in self.flat_stages and self.helpers.boss.is_exposing():
+        if "expose_boss" in self._stages_set and self.helpers.boss.is_exposing():
             if self.helpers.boss.is_reading():
                 self.command.info("BOSS is reading.")
             else:
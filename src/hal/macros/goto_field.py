@@ -9,19 +9,66 @@
 from __future__ import annotations
 
 import asyncio
-from time import time
-
-import numpy
+from dataclasses import dataclass
+from math import cos, radians
+from time import monotonic, time
 
 from hal import config
 from hal.exceptions import HALError, MacroError
 from hal.helpers.lamps import LampsHelperAPO, LampsHelperLCO
 from hal.macros import Macro
+from hal.macros.macro import StageStatus
 
 
 __all__ = ["GotoFieldAPOMacro"]
 
 
+# Lamps used for each calibration. Tuples so that they are not rebuilt on each run.
+_FLAT_LAMPS = ("ff",)
+_ARC_LAMPS = ("HgCd", "Ne")
+_FVC_ARC_LAMPS = ("HgCd",)
+
+# Seconds the arc lamps need to be on for the hartmanns. Less than a full warm-up.
+_HARTMANN_WARMUP = {"HgCd": 10, "Ne": 5}
+
+_LCO_FLAT_LAMPS = ("TCS_FF",)
+_LCO_ARC_LAMPS = ("HeAr", "Ne")
+
+# Lamps to start warming up in prepare, keyed by (observatory, mode, do_fvc). Any
+# combination not listed means all lamps should be off.
+_PREPARE_LAMPS = {
+    ("APO", "flat", False): _FLAT_LAMPS,
+    ("APO", "arcs", False): _ARC_LAMPS,
+    ("APO", "arcs", True): _FVC_ARC_LAMPS,
+}
+
+# Stages that take BOSS calibrations.
+_CAL_STAGES = frozenset({"boss_flat", "boss_hartmann", "boss_arcs"})
+_ARC_STAGES = frozenset({"boss_hartmann", "boss_arcs"})
+
+# Stages that require stopping the guider and the telescope in prepare.
+_STOP_STAGES = _CAL_STAGES | {"fvc"}
+
+# Stages that do not need to finish for the configuration to be goto_complete.
+_GOTO_COMPLETE_IGNORE = frozenset({"acquire", "guide", "cleanup"})
+
+# TCC track commands for slews with a fixed rotator angle.
+_TRACK_ALTAZ = "track {az}, {alt} mount /rota={rot} /rottype=mount"
+_TRACK_ICRS = "track {ra}, {dec} icrs /rota={rot} /rottype=mount"
+
+
+@dataclass
+class _StageConfig:
+    """Per-run configuration values used by the calibration and guide stages."""
+
+    flat_time: float
+    arc_time: float
+    guider_time: float | None
+    acquisition: dict
+    min_rms: float
+    guide: dict
+
+
 class _GotoFieldBaseMacro(Macro):
     """Go to field macro."""
 
@@ -41,94 +88,152 @@ class _GotoFieldBaseMacro(Macro):
     __CLEANUP__ = ["cleanup"]
 
     _lamps_task: asyncio.Task | None = None
+    _lamps_task_lamps: tuple[str, ...] = ()
+    _ff_off_task: asyncio.Task | None = None
+    _last_slew: tuple[float, float, float] | None = None
+    _axes_stopped: bool = False
+
+    def __init__(self):
+        super().__init__()
+
+        # Bound once. Reloading the timeouts requires a new macro instance.
+        self._timeouts = config["timeouts"]
+
+        # The observatory is fixed for each subclass.
+        self._offset_keys = tuple(
+            f"slew_offsets.{self.observatory}.{axis}" for axis in ("ra", "dec", "rot")
+        )
+
+        # Fire-and-forget tasks. Cleanup waits for them before finishing.
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def _reset_internal(self, **opts):
+        """Binds the actor models used by the stages."""
+
+        models = self.actor.models
+        self._jaeger_model = models["jaeger"]
+        self._hartmann_model = models["hartmann"]
+
+        # The guider offset only changes with the configuration.
+        offset = self.config["guider_offset"]
+        self._guider_offset = " ".join(map(str, offset)) if offset else None
+
+        observatory = self.observatory
+        acquisition_config = self.config["acquisition"][observatory]
+
+        self._stage_config = _StageConfig(
+            flat_time=self.config["flat_time"][observatory],
+            arc_time=self.config["arc_time"][observatory],
+            guider_time=self.config["guider_time"],
+            # Arguments for ChernoHelper.acquire().
+            acquisition={
+                "exposure_time": acquisition_config["exposure_time"],
+                "max_exposure_time": acquisition_config["max_exposure_time"],
+                "dynamic_exposure_time": acquisition_config["dynamic_exposure_time"],
+                "target_rms": acquisition_config["target_rms"],
+                "max_iterations": acquisition_config["max_iterations"],
+                "wait_time": acquisition_config["wait_time"],
+            },
+            min_rms=acquisition_config["min_rms"],
+            guide=self.config["guide"][observatory],
+        )
+
+        return super()._reset_internal(**opts)
 
     async def prepare(self):
         """Check configuration and run pre-slew checks."""
 
+        command = self.command
+
         self._lamps_task = None
+        self._lamps_task_lamps = ()
+        self._ff_off_task = None
+        self._last_slew = None
+        self._axes_stopped = False
 
-        stages = self.flat_stages
+        stages = self._stages_set
 
         if "reconfigure" in stages:
-            configuration_loaded = self.actor.models["jaeger"]["configuration_loaded"]
+            configuration_loaded = self._jaeger_model["configuration_loaded"]
             last_seen = configuration_loaded.last_seen
 
             if last_seen is None:
-                self.command.warning("The age of the loaded configuration is unknown.")
+                command.warning("The age of the loaded configuration is unknown.")
             elif time() - last_seen > 3600:  # One hour
                 raise MacroError("Configuration is too old. Load a new configuration.")
 
         do_fvc = "fvc" in stages
         do_flat = "boss_flat" in stages
-        do_arcs = "boss_hartmann" in stages or "boss_arcs" in stages
+        do_arcs = not _ARC_STAGES.isdisjoint(stages)
+        do_stop = not _STOP_STAGES.isdisjoint(stages)
+
+        # Commands to cherno and the TCC that do not depend on each other.
+        stop_tasks = []
 
         # Stop the guider.
         # TODO: this will probably be different at LCO.
-        if do_fvc or do_flat or do_arcs:
+        if do_stop:
             if self.observatory == "APO":
                 assert self.helpers.tcc
 
-                await self.helpers.cherno.stop_guiding(self.command)
-                await self.helpers.tcc.axis_stop(self.command)
+                stop_tasks.append(self.helpers.cherno.stop_guiding(command))
+                stop_tasks.append(self.helpers.tcc.axis_stop(command))
+                self._axes_stopped = True
 
             else:
                 if "slew" in stages:
-                    await self.helpers.cherno.stop_guiding(self.command)
+                    stop_tasks.append(self.helpers.cherno.stop_guiding(command))
+
+        # Reference time for the lamp delay, which waits for the APOGEE shutter.
+        shutter_start = monotonic()
 
         # Ensure the APOGEE shutter is closed but don't wait for it.
         if "apogee" in self.actor.config["enabled_instruments"]:
-            asyncio.create_task(
+            self._background_task(
                 self.helpers.apogee.shutter(
-                    self.command,
+                    command,
                     open=False,
                     shutter="apogee",
                 )
             )
 
         # Reset cherno offsets.
-        self.command.debug("Resetting cherno offsets.")
-        await self.helpers.cherno.reset_offsets(self.command)
+        command.debug("Resetting cherno offsets.")
+        stop_tasks.append(self.helpers.cherno.reset_offsets(command))
+
+        await asyncio.gather(*stop_tasks)
+
+        # Checks on the FFS and lamps that can run at the same time.
+        pretasks = []
 
         # Start closing the FFS if they are open but do not block. Only close the FFS
         # if we're going to do BOSS cals, otherwise it's about 20 seconds of lost time.
         if do_flat or do_arcs:
-            await self._close_ffs(wait=False)
+            pretasks.append(self._close_ffs(wait=False))
 
         # If lamps are needed, turn them on now but do not wait for them to warm up.
         # Do not turn lamps if we are going to take an FVC image. We add a delay
         # since the APOGEE shutter is closing and we don't want to start turning on
         # the lamps until it's fully closed.
-        if self.observatory == "APO":
-            if do_flat and not do_fvc:
-                self._lamps_task = asyncio.create_task(
-                    self.helpers.lamps.turn_lamp(
-                        self.command,
-                        ["ff"],
-                        True,
-                        turn_off_others=True,
-                        delay=10,
-                    )
-                )
-            elif not do_flat and do_arcs:
-                if do_fvc:
-                    lamps = ["HgCd"]
-                else:
-                    lamps = ["HgCd", "Ne"]
-
-                self._lamps_task = asyncio.create_task(
-                    self.helpers.lamps.turn_lamp(
-                        self.command,
-                        lamps,
-                        True,
-                        turn_off_others=True,
-                        delay=10,
-                    )
+        mode = "flat" if do_flat else "arcs" if do_arcs else None
+        lamps = _PREPARE_LAMPS.get((self.observatory, mode, do_fvc))
+
+        if lamps is not None:
+            self._lamps_task_lamps = lamps
+            self._lamps_task = asyncio.create_task(
+                self.helpers.lamps.turn_lamp(
+                    command,
+                    lamps,
+                    True,
+                    turn_off_others=True,
+                    delay=10,
+                    ready_after=shutter_start,
                 )
-            else:
-                await self._all_lamps_off(wait=False)
-
+            )
         else:
-            await self._all_lamps_off(wait=False)
+            pretasks.append(self._all_lamps_off(wait=False))
+
+        await asyncio.gather(*pretasks)
 
     async def slew(self):
         """Slew to field but keep the rotator at a fixed position."""
@@ -154,17 +259,19 @@ class _GotoFieldBaseMacro(Macro):
     async def fvc(self):
         """Run the FVC loop."""
 
-        if "slew" in self.flat_stages and self.observatory == "APO":
+        if "slew" in self._stages_set and self.observatory == "APO":
             assert self.helpers.tcc
 
-            self.command.info("Halting the rotator.")
-            await self.helpers.tcc.axis_stop(self.command, axis="rot")
+            # The APO slew already halts the rotator, so this is usually a no-op.
+            if not self.helpers.tcc.check_axes_status("Halted", axes=("rot",)):
+                self.command.info("Halting the rotator.")
+                await self.helpers.tcc.axis_stop(self.command, axis="rot")
 
         self.command.info("Running FVC loop.")
         fvc_command = await self.send_command(
             "jaeger",
             "fvc loop",
-            time_limit=config["timeouts"]["fvc"],
+            time_limit=self._timeouts["fvc"],
             raise_on_fail=False,
         )
 
@@ -179,15 +286,16 @@ class _GotoFieldBaseMacro(Macro):
     async def lamps(self):
         """Ensures the correct lamps for calibrations are on."""
 
-        cal_stages = ["boss_flat", "boss_hartmann", "boss_arcs"]
-        if all([stage not in self.flat_stages for stage in cal_stages]):
+        stages = self._stages_set
+
+        if _CAL_STAGES.isdisjoint(stages):
             return
 
         # If we are going to take BOSS cals, start warming up lamps now (some may
         # already be on).
-        if "boss_flat" in self.flat_stages:
+        if "boss_flat" in stages:
             mode = "flat"
-        elif "boss_hartmann" in self.flat_stages:
+        elif "boss_hartmann" in stages:
             mode = "hartmann"
         else:
             mode = "arcs"
@@ -197,37 +305,57 @@ class _GotoFieldBaseMacro(Macro):
     async def boss_flat(self):
         """Takes the BOSS flat."""
 
-        self.command.info("Taking BOSS flat.")
+        command = self.command
+        boss = self.helpers.boss
+
+        command.info("Taking BOSS flat.")
+
+        # Warm up the lamps while BOSS reads out, if there is a pending readout.
+        tasks = [self._ensure_lamps(mode="flat")]
+
+        if boss.readout_pending:
+            command.info("Waiting for BOSS to read out.")
+            tasks.append(boss.readout(command))
 
-        await self._ensure_lamps(mode="flat")
+        await asyncio.gather(*tasks)
 
         # Now take the flat. Do not read it yet.
-        flat_time = self.config["flat_time"][self.observatory]
+        flat_time = self._stage_config.flat_time
 
-        self.command.debug("Starting BOSS flat exposure.")
+        command.debug("Starting BOSS flat exposure.")
 
-        await self.helpers.boss.expose(
-            self.command,
+        await boss.expose(
+            command,
             flat_time,
             exp_type="flat",
             readout=True,
             read_async=True,
         )
 
-        ff_lamp = "ff" if self.observatory == "APO" else "TCS_FF"
-        asyncio.create_task(self.helpers.lamps.turn_lamp(self.command, ff_lamp, False))
+        # Keep a reference to the task so that the arcs/hartmann can wait for the
+        # FF lamp to be off before turning on their lamps.
+        ff_lamp = _FLAT_LAMPS if self.observatory == "APO" else _LCO_FLAT_LAMPS
+        self._ff_off_task = asyncio.create_task(
+            self.helpers.lamps.turn_lamp(command, ff_lamp, False)
+        )
 
     async def boss_hartmann(self):
         """Takes the hartmann sequence."""
 
-        await self._ensure_lamps(mode="hartmann")
+        command = self.command
+        boss = self.helpers.boss
+
+        # Warm up the lamps while BOSS reads out, if there is a pending readout.
+        tasks = [self._ensure_lamps(mode="hartmann")]
 
-        if self.helpers.boss.readout_pending:  # Potential readout from the flat.
-            self.command.info("Waiting for BOSS to read out.")
-            await self.helpers.boss.readout(self.command)
+        if boss.readout_pending:  # Potential readout from the flat.
+            command.info("Waiting for BOSS to read out.")
+            tasks.append(boss.readout(command))
+
+        await asyncio.gather(*tasks)
 
         # Run hartmann and adjust the collimator but ignore residuals.
-        self.command.info("Running hartmann collimate.")
+        command.info("Running hartmann collimate.")
 
         if self.observatory == "APO":
             command_string = "collimate ignoreResiduals"
@@ -237,36 +365,42 @@ class _GotoFieldBaseMacro(Macro):
         await self.send_command(
             "hartmann",
             command_string,
-            time_limit=config["timeouts"]["hartmann"],
+            time_limit=self._timeouts["hartmann"],
         )
 
         # Now check if there are residuals that require modifying the blue ring.
         residuals_kw = "sp1Residuals" if self.observatory == "APO" else "sp2Residuals"
-        residuals = self.actor.models["hartmann"][residuals_kw][2]
+        residuals = self._hartmann_model[residuals_kw][2]
         if residuals != "OK":
             raise MacroError(
                 "Please adjust the blue ring and run goto-field again. "
                 "The collimator has been adjusted."
             )
 
-        if "boss_arcs" not in self.flat_stages:
+        if "boss_arcs" not in self._stages_set:
             await self._all_lamps_off(wait=False)
 
     async def boss_arcs(self):
         """Takes BOSS arcs."""
 
-        await self._ensure_lamps(mode="arcs")
+        command = self.command
+        boss = self.helpers.boss
 
-        if self.helpers.boss.readout_pending:
-            self.command.info("Waiting for BOSS to read out.")
-            await self.helpers.boss.readout(self.command)
+        # Warm up the lamps while BOSS reads out, if there is a pending readout.
+        tasks = [self._ensure_lamps(mode="arcs")]
 
-        self.command.info("Taking BOSS arc.")
+        if boss.readout_pending:
+            command.info("Waiting for BOSS to read out.")
+            tasks.append(boss.readout(command))
 
-        arc_time = self.config["arc_time"][self.observatory]
+        await asyncio.gather(*tasks)
 
-        await self.helpers.boss.expose(
-            self.command,
+        command.info("Taking BOSS arc.")
+
+        arc_time = self._stage_config.arc_time
+
+        await boss.expose(
+            command,
             arc_time,
             exp_type="arc",
             readout=True,
@@ -278,42 +412,29 @@ class _GotoFieldBaseMacro(Macro):
     async def acquire(self):
         """Acquires the field."""
 
+        command = self.command
+
         self._mark_design_as_goto_complete()
 
         if self.helpers.cherno.is_guiding():
-            self.command.info("Already guiding.")
+            command.info("Already guiding.")
             return
 
         await self._guide_preconditions("acquire")
 
-        acquisition_config = self.config["acquisition"][self.observatory]
+        stage_config = self._stage_config
+        min_rms = stage_config.min_rms
 
-        exposure_time = acquisition_config["exposure_time"]
-        max_exposure_time = acquisition_config["max_exposure_time"]
-        dynamic_exposure_time = acquisition_config["dynamic_exposure_time"]
-        target_rms = acquisition_config["target_rms"]
-        min_rms = acquisition_config["min_rms"]
-        max_iterations = acquisition_config["max_iterations"]
-        wait_time = acquisition_config["wait_time"]
-
-        self.command.info("Acquiring field.")
+        command.info("Acquiring field.")
 
         try:
-            await self.helpers.cherno.acquire(
-                self.command,
-                exposure_time=exposure_time,
-                max_exposure_time=max_exposure_time,
-                dynamic_exposure_time=dynamic_exposure_time,
-                target_rms=target_rms,
-                max_iterations=max_iterations,
-                wait_time=wait_time,
-            )
+            await self.helpers.cherno.acquire(command, **stage_config.acquisition)
         except HALError:
             # If we have exhausted the number of exposures and not reached
             # the target RMS, check if we reach the minimum RMS. If so, warn
             # but continue.
             if self.helpers.cherno.guiding_at_rms(min_rms, allow_not_guiding=True):
-                self.command.warning(
+                command.warning(
                     f"Target RMS not reached but RMS < {min_rms} arcsec. Will continue."
                 )
             else:
@@ -330,9 +451,9 @@ class _GotoFieldBaseMacro(Macro):
 
         await self._guide_preconditions("guide")
 
-        guide_config = self.config["guide"][self.observatory]
-        if self.config["guider_time"] is not None:
-            exposure_time = self.config["guider_time"]
+        guide_config = self._stage_config.guide
+        if self._stage_config.guider_time is not None:
+            exposure_time = self._stage_config.guider_time
         else:
             exposure_time = guide_config["exposure_time"]
 
@@ -353,14 +474,34 @@ class _GotoFieldBaseMacro(Macro):
         # If enough stages have run, mark this configuration as goto_complete.
         self._mark_design_as_goto_complete()
 
-        if self._lamps_task is not None and not self._lamps_task.done():
-            self._lamps_task.cancel()
+        # Cancel the lamp tasks (a no-op if they are done) and let any fire-and-forget
+        # commands finish before checking the lamps. Gathering with return_exceptions
+        # consumes the CancelledError and any errors from the tasks.
+        pending = [*self._background_tasks]
+        for task in (self._lamps_task, self._ff_off_task):
+            if task is not None:
+                task.cancel()
+                pending.append(task)
+
+        if len(pending) > 0:
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        await self._all_lamps_off()
+        # Turn off the lamps and read any pending BOSS exposure at the same time.
+        tasks = [self._all_lamps_off()]
 
-        # Read any pending BOSS exposure.
         if self.helpers.boss.readout_pending:
-            await self.helpers.boss.readout(self.command)
+            tasks.append(self.helpers.boss.readout(self.command))
+
+        await asyncio.gather(*tasks)
+
+    def _background_task(self, coro) -> asyncio.Task:
+        """Schedules a coroutine as a task that is awaited during cleanup."""
+
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+        return task
 
     def _mark_design_as_goto_complete(self):
         """Marks the design as goto_complete."""
@@ -374,18 +515,18 @@ class _GotoFieldBaseMacro(Macro):
     def _get_pointing(self):
         """Returns the configuration pointing."""
 
-        configuration_loaded = self.actor.models["jaeger"]["configuration_loaded"]
-        ra, dec, pa = configuration_loaded[3:6]
+        configuration_loaded = self._jaeger_model["configuration_loaded"].value
+        ra = configuration_loaded[3]
+        dec = configuration_loaded[4]
+        pa = configuration_loaded[5]
 
-        if any([ra is None, dec is None, pa is None]):
+        if ra is None or dec is None or pa is None:
             raise MacroError("Unknown RA/Dec/PA coordinates for field.")
 
-        ra_off = self.config[f"slew_offsets.{self.observatory}.ra"]
-        dec_off = self.config[f"slew_offsets.{self.observatory}.dec"]
-        rot_off = self.config[f"slew_offsets.{self.observatory}.rot"]
+        ra_off, dec_off, rot_off = (self.config[key] for key in self._offset_keys)
 
         if ra_off is not None:
-            ra += ra_off / numpy.cos(numpy.radians(dec))
+            ra += ra_off / cos(radians(dec))
 
         dec += dec_off or 0.0
         pa += rot_off or 0.0
@@ -395,11 +536,9 @@ class _GotoFieldBaseMacro(Macro):
     async def _set_guider_offset(self):
         """Sets the guider offset."""
 
-        offset = self.config["guider_offset"]
-        if offset is not None:
-            offset = " ".join(map(str, offset))
-            self.command.info(f"Setting guide offset to {offset}.")
-            await self.send_command("cherno", f"offset {offset}")
+        if self._guider_offset is not None:
+            self.command.info(f"Setting guide offset to {self._guider_offset}.")
+            await self.send_command("cherno", f"offset {self._guider_offset}")
 
     def _is_goto_complete(self):
         """Determines whether we can mark the configuration as ``goto_complete```.
@@ -410,10 +549,10 @@ class _GotoFieldBaseMacro(Macro):
 
         """
 
-        for stage in self.flat_stages:
-            if stage in ["acquire", "guide", "cleanup"]:
+        for stage, status in self.stage_status.items():
+            if stage in _GOTO_COMPLETE_IGNORE:
                 continue
-            if not self.is_stage_done(stage):
+            if status != StageStatus.FINISHED:
                 return False
 
         return True
@@ -444,14 +583,40 @@ class GotoFieldAPOMacro(_GotoFieldBaseMacro):
 
     observatory = "APO"
 
+    _slew_params: tuple[float, float, float, bool, bool, bool]
+
+    # Whether this run has already confirmed the FFS are open.
+    _ffs_open: bool = False
+
+    def _reset_internal(self, **opts):
+        """Reads the slew configuration for this run."""
+
+        # The fixed position at which to slew for the FVC loop.
+        fvc = self.config["fvc"]
+
+        self._slew_params = (
+            fvc["alt"],
+            fvc["az"],
+            fvc["rot"],
+            self.config["keep_offsets"],
+            self.config["fixed_rot"],
+            self.config["fixed_altaz"],
+        )
+
+        self._ffs_open = False
+
+        return super()._reset_internal(**opts)
+
     async def slew(self):
         """Slew to field but keep the rotator at a fixed position."""
 
         assert self.helpers.tcc
 
-        # Wait five seconds to give time for the axis stop we issued in Prepare to
-        # take effect.
-        await asyncio.sleep(5)
+        # Give time for the axis stop we issued in Prepare to take effect, but
+        # continue as soon as the TCC reports the axes halted. If prepare did not
+        # stop the axes there is nothing to wait for.
+        if self._axes_stopped:
+            await self.helpers.tcc.wait_for_axes_status("Halted", timeout=5)
 
         ra, dec, pa = self._get_pointing()
 
@@ -459,13 +624,9 @@ class GotoFieldAPOMacro(_GotoFieldBaseMacro):
         if not result:
             raise HALError("Some axes are not clear. Cannot continue.")
 
-        # The fixed position at which to slew for the FVC loop.
-        alt = self.config["fvc"]["alt"]
-        az = self.config["fvc"]["az"]
-        rot = self.config["fvc"]["rot"]
-        keep_offsets = self.config["keep_offsets"]
+        alt, az, rot, keep_offsets, fixed_rot, fixed_altaz = self._slew_params
 
-        if self.config["fixed_rot"] is False:
+        if fixed_rot is False:
             self.command.info("Slewing to field RA/Dec/PA.")
             await self.helpers.tcc.goto_position(
                 self.command,
@@ -473,14 +634,15 @@ class GotoFieldAPOMacro(_GotoFieldBaseMacro):
                 rotwrap="middle",
                 keep_offsets=keep_offsets,
             )
+            self._last_slew = (ra, dec, pa)
         else:
-            if self.config["fixed_altaz"]:
+            if fixed_altaz:
                 self.command.info("Slewing to field with fixed rotator angle.")
-                track_command = f"track {az}, {alt} mount /rota={rot} /rottype=mount"
+                track_command = _TRACK_ALTAZ.format(az=az, alt=alt, rot=rot)
 
             else:
                 self.command.info("Slewing to field with fixed alt/az/rot position.")
-                track_command = f"track {ra}, {dec} icrs /rota={rot} /rottype=mount"
+                track_command = _TRACK_ICRS.format(ra=ra, dec=dec, rot=rot)
 
             slew_result = await self.helpers.tcc.do_slew(
                 self.command,
@@ -503,6 +665,13 @@ class GotoFieldAPOMacro(_GotoFieldBaseMacro):
 
         ra, dec, pa = self._get_pointing()
 
+        # If we are already tracking the field there is no need to re-slew.
+        if self._last_slew == (ra, dec, pa) and self.helpers.tcc.check_axes_status(
+            "Tracking"
+        ):
+            self.command.info("Already tracking the field. Not re-slewing.")
+            return
+
         self.command.info("Re-slewing to field.")
 
         # Start going to position asynchronously.
@@ -512,10 +681,13 @@ class GotoFieldAPOMacro(_GotoFieldBaseMacro):
             rotwrap="nearest",
             keep_offsets=self.config["keep_offsets"],
         )
+        self._last_slew = (ra, dec, pa)
 
     async def _all_lamps_off(self, wait: bool = True):
         """Turns all the lamps off after checking them."""
 
+        assert isinstance(self.helpers.lamps, LampsHelperAPO)
+
         # Check lamp status.
         command_off: bool = False
         lamp_status = self.helpers.lamps.list_status()
@@ -525,75 +697,108 @@ class GotoFieldAPOMacro(_GotoFieldBaseMacro):
                 command_off = True
 
         if command_off:
-            task = asyncio.create_task(self.helpers.lamps.all_off(self.command))
             if wait:
-                await task
+                await self.helpers.lamps.all_off(self.command)
+            else:
+                self._background_task(self.helpers.lamps.all_off(self.command))
 
     async def _ensure_lamps(self, mode: str):
         """Ensures the lamps for flats/arcs/hartmann are on."""
 
-        assert isinstance(self.helpers.lamps, LampsHelperAPO)
+        command = self.command
+        lamps = self.helpers.lamps
 
-        # Make sure FFS are closed.
+        assert isinstance(lamps, LampsHelperAPO)
+
+        # Make sure FFS are closed. _close_ffs() does nothing if they already are.
         close_ffs = asyncio.create_task(self._close_ffs())
 
+        # Wait until the FF lamp from the flat is off before turning on the arcs.
+        if mode != "flat" and self._ff_off_task and not self._ff_off_task.done():
+            await self._ff_off_task
+
+        # For arcs we need the lamps fully warmed up, so if prepare() already started
+        # turning all of them on, wait for that task instead of commanding them
+        # again. If it only turned on some (e.g., HgCd when fvc is selected), the
+        # missing lamps are turned on below and warm up at the same time.
+        if (
+            mode == "arcs"
+            and self._lamps_task
+            and not self._lamps_task.done()
+            and set(_ARC_LAMPS).issubset(self._lamps_task_lamps)
+        ):
+            await self._lamps_task
+
         # Check lamps. Depending on the other stages HgCd may be on but Ne not. Loop
         # over each on of the lamps and if it's not on, turn it on. If any of them is
         # not on wait for 10 seconds, which is enough for the Hartmanns.
-        lamp_status = self.helpers.lamps.list_status()
+        lamp_status = lamps.list_status()
 
         if mode == "flat":
-            lamp_status = self.helpers.lamps.list_status()
             if lamp_status["ff"][3] is False:
                 if self._lamps_task and not self._lamps_task.done():
                     # Lamps have been commanded on but are not warmed up yet.
                     await self._lamps_task
                 else:
-                    self.command.warning("Turning FF lamp on.")
-                    await self.helpers.lamps.turn_lamp(
-                        self.command,
-                        ["ff"],
+                    command.warning("Turning FF lamp on.")
+                    await lamps.turn_lamp(
+                        command,
+                        _FLAT_LAMPS,
                         True,
                         turn_off_others=True,
                     )
 
         else:
             wait: float = 0
-            for lamp in ["HgCd", "Ne"]:
+
+            # Time each lamp must have been on before we can continue.
+            warmup: dict[str, float] = {}
+            full_warmup = LampsHelperAPO.WARMUP
+
+            # Lamps that need to be turned on.
+            needed: list[str] = []
+
+            for lamp in _ARC_LAMPS:
                 if lamp_status[lamp][0] is False:
-                    self.command.warning(f"Turning {lamp} lamp on.")
-                    asyncio.create_task(
-                        self.helpers.lamps.turn_lamp(
-                            self.command,
-                            [lamp],
-                            True,
-                            turn_off_others=False,
-                        )
-                    )
+                    command.warning(f"Turning {lamp} lamp on.")
+                    needed.append(lamp)
 
                     # For hartmann we don't need to wait until the lamps have fully
                     # warmed up. For arcs we wait until they are.
                     if mode == "hartmann":
-                        if lamp == "HgCd":
-                            wait = 10 if wait < 10 else wait
-                        else:
-                            wait = 5 if wait < 5 else wait
+                        warmup[lamp] = _HARTMANN_WARMUP[lamp]
                     else:
-                        if LampsHelperAPO.WARMUP[lamp] > wait:
-                            wait = LampsHelperAPO.WARMUP[lamp]
+                        warmup[lamp] = full_warmup[lamp]
+
+                    wait = max(wait, warmup[lamp])
 
                 elif mode == "arcs" and lamp_status[lamp][3] is False:
                     elapsed = lamp_status[lamp][2]
-                    wait_lamp = LampsHelperAPO.WARMUP[lamp] - elapsed
-                    if wait < wait_lamp:
-                        wait = wait_lamp
+                    warmup[lamp] = full_warmup[lamp]
+
+                    wait = max(wait, full_warmup[lamp] - elapsed)
+
+            if len(needed) > 0:
+                asyncio.create_task(
+                    lamps.turn_lamp(
+                        command,
+                        needed,
+                        True,
+                        turn_off_others=False,
+                    )
+                )
 
             if wait > 0:
-                # TODO: maybe here we should confirm that the lamps are turning on.
-                # We don't want to await the tasks though, because in some cases we
-                # are waiting less time than the full warm up time.
-                self.command.info(f"Waiting {wait} seconds for the lamps to warm-up.")
-                await asyncio.sleep(wait)
+                # Return as soon as the lamps report they have been on long enough,
+                # but never wait longer than the expected warm-up time. We don't
+                # await the turn_lamp tasks because in some cases we are waiting
+                # less time than the full warm-up time.
+                command.info(f"Waiting up to {wait} seconds for the lamps to warm-up.")
+                await lamps.wait_for_warmup(
+                    list(warmup),
+                    timeout=wait,
+                    warmup=warmup,
+                )
 
         # Ensure FFS have fully closed.
         await close_ffs
@@ -604,13 +809,15 @@ class GotoFieldAPOMacro(_GotoFieldBaseMacro):
         assert self.helpers.ffs
 
         if not self.helpers.ffs.all_closed():
+            self._ffs_open = False
+
             self.command.info("Closing FFS")
             task = self.helpers.ffs.close(self.command)
 
             if wait:
                 await task
             else:
-                asyncio.create_task(task)
+                self._background_task(task)
 
     async def _guide_preconditions(self, stage: str):
         """Run guide preconditions."""
@@ -619,23 +826,30 @@ class GotoFieldAPOMacro(_GotoFieldBaseMacro):
 
         pretasks = []
 
-        if (stage == "acquire" and "reslew" not in self.flat_stages) or (
-            stage == "guide" and "acquire" not in self.flat_stages
+        stages = self._stages_set
+        if (stage == "acquire" and "reslew" not in stages) or (
+            stage == "guide" and "acquire" not in stages
         ):
             self.command.info("Re-slewing to field.")
             pretasks.append(self.reslew())
 
-        if not self.helpers.ffs.all_open():
+        # If acquire already opened the FFS we don't need to check them for guide.
+        if not self._ffs_open and not self.helpers.ffs.all_open():
             self.command.info("Opening FFS")
             pretasks.append(self.helpers.ffs.open(self.command))
 
-        # Open FFS and re-slew at the same time.
-        await asyncio.gather(*pretasks)
+        # Open FFS and re-slew at the same time. Skip the gather wrapper if there
+        # is only one thing to do.
+        if len(pretasks) == 1:
+            await pretasks[0]
+        elif len(pretasks) > 1:
+            await asyncio.gather(*pretasks)
 
-        # A bit of delay to make sure the axis status keyword is updated.
-        await asyncio.sleep(1)
+        self._ffs_open = True
 
-        if not self.helpers.tcc.check_axes_status("Tracking"):
+        # Give the axis status keyword some time to update, but continue as soon
+        # as all the axes are tracking.
+        if not await self.helpers.tcc.wait_for_axes_status("Tracking", timeout=1):
             raise MacroError("Axes must be tracking for acquisition.")
 
 
@@ -657,9 +871,9 @@ class GotoFieldLCOMacro(_GotoFieldBaseMacro):  # pragma: no cover
     async def slew(self):
         """Slews the telescope."""
 
-        do_flat = "boss_flat" in self.flat_stages
-        do_arcs = "boss_hartmann" in self.flat_stages or "boss_arcs" in self.flat_stages
-        do_screen = True if do_flat or do_arcs else False
+        stages = self._stages_set
+
+        do_screen = not _CAL_STAGES.isdisjoint(stages)
 
         await self._slew_telescope(screen=do_screen)
 
@@ -672,9 +886,10 @@ class GotoFieldLCOMacro(_GotoFieldBaseMacro):  # pragma: no cover
     async def _all_lamps_off(self, wait: bool = True):
         """Turns all the lamps off."""
 
-        task = asyncio.create_task(self.helpers.lamps.all_off(self.command))
         if wait:
-            await task
+            await self.helpers.lamps.all_off(self.command)
+        else:
+            self._background_task(self.helpers.lamps.all_off(self.command))
 
     async def _ensure_lamps(self, mode: str):
         """Makes sure the lamps are configured properly."""
@@ -685,10 +900,14 @@ class GotoFieldLCOMacro(_GotoFieldBaseMacro):  # pragma: no cover
             # Lamps have been commanded on but are not warmed up yet.
             await self._lamps_task
 
+        # Wait until the FF lamp from the flat is off before turning on the arcs.
+        if mode != "flat" and self._ff_off_task and not self._ff_off_task.done():
+            await self._ff_off_task
+
         if mode == "flat":
             await self.helpers.lamps.turn_lamp(
                 self.command,
-                ["TCS_FF"],
+                _LCO_FLAT_LAMPS,
                 True,
                 turn_off_others=True,
             )
@@ -696,7 +915,7 @@ class GotoFieldLCOMacro(_GotoFieldBaseMacro):  # pragma: no cover
         else:
             await self.helpers.lamps.turn_lamp(
                 self.command,
-                ["HeAr", "Ne"],
+                _LCO_ARC_LAMPS,
                 True,
                 turn_off_others=True,
             )
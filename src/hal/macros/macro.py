@@ -14,7 +14,7 @@ import warnings
 from collections import defaultdict
 from contextlib import suppress
 
-from typing import TYPE_CHECKING, Any, ClassVar, Coroutine, Optional, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Coroutine, Optional, Sequence, Union
 
 from clu import Command, CommandStatus
 
@@ -33,22 +33,7 @@ __all__ = ["Macro"]
 StageType = Union[str, tuple[str, ...], list[str]]
 
 
-def record_overhead(macro: Macro):
-    """Runs a macro stage and records its overhead."""
-
-    async def record_overhead_wrapper(stage_coro: Coroutine[Any, Any, None]):
-        overhead_helper = OverheadHelper(
-            macro,
-            stage_coro.__name__,
-            macro_id=macro.macro_id,
-        )
-        async with overhead_helper:
-            await stage_coro
-
-    return record_overhead_wrapper
-
-
-class StageStatus(enum.Flag):
+class StageStatus(enum.IntEnum):
     """Stage status codes."""
 
     WAITING = enum.auto()
@@ -59,7 +44,17 @@ class StageStatus(enum.Flag):
     FAILED = enum.auto()
 
 
-def flatten(stages: list[StageType]) -> list[str]:
+# Lower-case names used when outputting the stage status.
+_STATUS_NAMES = {status: str(status.name).lower() for status in StageStatus}
+
+
+def _none():
+    """Default factory for missing macro configuration options."""
+
+    return None
+
+
+def flatten(stages: Sequence[StageType]) -> list[str]:
     flat = []
     for stage in stages:
         if isinstance(stage, str):
@@ -75,37 +70,56 @@ class Macro:
     name: ClassVar[str]
     observatory: str | None = None
 
-    __RUNNING__: ClassVar[list[str]] = []
+    # Names of the running macros. A dict used as an ordered set, with a cached
+    # list snapshot for output that is only rebuilt when the dict changes.
+    __RUNNING__: ClassVar[dict[str, None]] = {}
+    _running_snapshot: ClassVar[list[str]] = []
 
     __STAGES__: list[StageType]
     __PRECONDITIONS__: list[StageType] = []
     __CLEANUP__: list[StageType] = []
 
-    def __init__(self):
-        if not hasattr(self, "__STAGES__"):
-            raise MacroError("Must override __STAGES__.")
+    # Computed once per subclass from the stage lists above.
+    _full_stages: ClassVar[list[StageType]]
+    _selectable_stages: ClassVar[frozenset[str]]
+    _all_flat_stages: ClassVar[list[str]]
+    _cleanup_set: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-        self.stages = self.__PRECONDITIONS__ + self.__STAGES__ + self.__CLEANUP__
+        # Intermediate base classes may not define stages.
+        if not hasattr(cls, "__STAGES__"):
+            return
 
-        self.flat_stages = flatten(self.stages)
+        cls._full_stages = cls.__PRECONDITIONS__ + cls.__STAGES__ + cls.__CLEANUP__
+        cls._selectable_stages = frozenset(flatten(cls.__STAGES__))
+        cls._all_flat_stages = flatten(cls.__STAGES__ + cls.__CLEANUP__)
+        cls._cleanup_set = frozenset(flatten(cls.__CLEANUP__))
 
-        for stage in self.__PRECONDITIONS__ + self.__CLEANUP__:
+        for stage in cls.__PRECONDITIONS__ + cls.__CLEANUP__:
             if not isinstance(stage, str):
                 raise MacroError(
                     "Preconditions and cleanup stages cannot run in parallel."
                 )
-            if stage in flatten(self.__STAGES__):
+            if stage in cls._selectable_stages:
                 raise MacroError(f"Stage {stage} cannot be a selectable stage.")
 
-        if len(self.stages) != len(set(self.stages)):
+        if len(cls._full_stages) != len(set(cls._full_stages)):
             raise MacroError("Duplicate stages found.")
 
-        self.stage_status = {st: StageStatus.WAITING for st in flatten(self.stages)}
+    def __init__(self):
+        if not hasattr(self, "__STAGES__"):
+            raise MacroError("Must override __STAGES__.")
+
+        self.stages: tuple[StageType, ...] = tuple(self._full_stages)
+        self._cache_stages()
+
+        self.stage_status = dict.fromkeys(self.flat_stages, StageStatus.WAITING)
+        self._reset_status_template()
 
         self._base_config = config["macros"].get(self.name, {}).copy()
-        self.config: defaultdict[str, Any] = defaultdict(
-            lambda: None, self._base_config.copy()
-        )
+        self.config: defaultdict[str, Any] = defaultdict(_none, self._base_config)
 
         self.command: HALCommandType
 
@@ -120,9 +134,26 @@ class Macro:
         self._running_event.set()  # Won't unset until the macro is actually running.
 
     def __repr__(self):
-        stages = flatten(self.stages)
+        stages = list(self.flat_stages)
         return f"<{self.__class__.__name__} (name={self.name!r}, stages={stages})>"
 
+    def _cache_stages(self):
+        """Caches the flattened stages. Must be called when ``stages`` changes."""
+
+        # For each entry in stages, the names of the stage methods to run and the
+        # index in flat_stages of its first stage. The methods are looked up when
+        # the stage runs so that they can be replaced after a reset. The flattened
+        # stages are built in the same pass.
+        flat_stages: list[str] = []
+        self._stage_plan: list[tuple[StageType, tuple[str, ...], int]] = []
+        for stage in self.stages:
+            names = (stage,) if isinstance(stage, str) else tuple(stage)
+            self._stage_plan.append((stage, names, len(flat_stages)))
+            flat_stages += names
+
+        self.flat_stages = tuple(flat_stages)
+        self._stages_set = frozenset(self.flat_stages)
+
     def _reset_internal(self, **opts):
         """Internal reset method that can be overridden by the subclasses."""
 
@@ -157,58 +188,71 @@ class Macro:
         if self.observatory is None and command.actor is not None:
             self.observatory = command.actor.observatory
 
+        stages: list[StageType]
         if reset_stages is None:
-            self.stages = self.__PRECONDITIONS__ + self.__STAGES__ + self.__CLEANUP__
+            stages = self._full_stages.copy()
         else:
-            self.stages = []
+            stages = []
 
-            if force is False and all([isinstance(x, str) for x in reset_stages]):
+            if force is False and all(isinstance(x, str) for x in reset_stages):
+                reset_set = set(reset_stages)
                 for stage in self.__STAGES__:
-                    if isinstance(stage, str) and stage in reset_stages:
-                        self.stages.append(stage)
+                    if isinstance(stage, str) and stage in reset_set:
+                        stages.append(stage)
                     elif isinstance(stage, (tuple, list)):
-                        if all([x in reset_stages for x in stage]):
-                            self.stages.append(stage)
+                        if reset_set.issuperset(stage):
+                            stages.append(stage)
                         else:
                             for x in stage:
-                                if x in reset_stages:
-                                    self.stages.append(x)
+                                if x in reset_set:
+                                    stages.append(x)
             else:
-                self.stages = reset_stages.copy()
+                stages = reset_stages.copy()
 
-            for stage in flatten(self.stages):
-                if stage not in flatten(self.__STAGES__):
+            selected = set(flatten(stages))
+            for stage in selected:
+                if stage not in self._selectable_stages:
                     raise MacroError(f"Unknown stage {stage}.")
 
             for pre_stage in self.__PRECONDITIONS__:
-                if pre_stage not in flatten(self.stages):
-                    self.stages.insert(0, pre_stage)
+                if pre_stage not in selected:
+                    stages.insert(0, pre_stage)
 
             for cleanup_stage in self.__CLEANUP__:
-                if cleanup_stage not in flatten(self.stages):
-                    self.stages.append(cleanup_stage)
+                if cleanup_stage not in selected:
+                    stages.append(cleanup_stage)
 
-        if len(self.stages) == 0:
+        if len(stages) == 0:
             raise MacroError("No stages found.")
 
-        self.flat_stages = flatten(self.stages)
+        # The stages only change on reset, so we freeze them and cache the
+        # flattened stages here.
+        self.stages = tuple(stages)
+        self._cache_stages()
 
         # Reload the config and update it with custom options for this run.
+        # Reuse the same dictionary rather than allocating a new one on each reset.
+        config = self.config
         if reset_config:
-            self.config = defaultdict(lambda: None, self._base_config.copy())
+            config.clear()
+            config.update(self._base_config)
 
-        self.config.update(
-            {k: v for k, v in opts.items() if k not in self.config or v is not None}
-        )
+        for key, value in opts.items():
+            if value is not None or key not in config:
+                config[key] = value
 
         self.failed = False
         self.cancelled = False
 
-        self.stage_status = {st: StageStatus.WAITING for st in flatten(self.stages)}
+        self.stage_status = dict.fromkeys(self.flat_stages, StageStatus.WAITING)
+        self._reset_status_template()
 
         for st in self.stage_status:
-            if getattr(self, st, None) is None:
+            stage_method = getattr(self, st, None)
+            if stage_method is None:
                 raise MacroError(f"Cannot find method for stage {st!r}.")
+            if not asyncio.iscoroutinefunction(stage_method):
+                raise MacroError(f"Stage function for {st} is not a coroutine.")
 
         self._reset_internal(**opts)
 
@@ -222,6 +266,30 @@ class Macro:
 
         self.list_stages()
 
+    def _reset_status_template(self):
+        """Builds the ``stage_status`` keyword, which is updated in place."""
+
+        self._status_template: list[str] = [self.name]
+        self._status_idx: dict[str, int] = {}
+        self._failed_count: int = 0
+
+        for stage, status in self.stage_status.items():
+            self._status_idx[stage] = len(self._status_template) + 1
+            self._status_template += [stage, _STATUS_NAMES[status]]
+            if status == StageStatus.FAILED:
+                self._failed_count += 1
+
+    def _set_status(self, stage: str, status: StageStatus):
+        """Sets the status of a stage without outputting it."""
+
+        if self.stage_status[stage] == StageStatus.FAILED:
+            self._failed_count -= 1
+        if status == StageStatus.FAILED:
+            self._failed_count += 1
+
+        self.stage_status[stage] = status
+        self._status_template[self._status_idx[stage]] = _STATUS_NAMES[status]
+
     @property
     def actor(self):
         """Returns the command actor."""
@@ -234,6 +302,12 @@ class Macro:
 
         return self.actor.helpers
 
+    @property
+    def stages_set(self) -> frozenset[str]:
+        """Returns the set of stages selected for this run."""
+
+        return self._stages_set
+
     @property
     def running(self):
         """Is the macro running?"""
@@ -249,15 +323,15 @@ class Macro:
         self._running = is_running
 
         if is_running is True and self.name not in Macro.__RUNNING__:
-            Macro.__RUNNING__.append(self.name)
+            Macro.__RUNNING__[self.name] = None
+            Macro._running_snapshot = list(Macro.__RUNNING__)
         elif is_running is False and self.name in Macro.__RUNNING__:
-            Macro.__RUNNING__.remove(self.name)
+            del Macro.__RUNNING__[self.name]
+            Macro._running_snapshot = list(Macro.__RUNNING__)
 
-        self.command.debug(running_macros=Macro.__RUNNING__)
+        self.command.debug(running_macros=Macro._running_snapshot)
 
         if is_running:
-            if not self._running_event.is_set():
-                self._running_event.set()
             self._running_event.clear()
         else:
             self._running_event.set()
@@ -281,9 +355,24 @@ class Macro:
     ):
         """Set the stage status and inform the actor."""
 
+        # Fast path for the most common case, a single stage.
         if isinstance(stages, str):
-            stages = (stages,)
+            if stages not in self.stage_status:
+                warnings.warn(
+                    f"Cannot find stage {stages} in list. "
+                    "Maybe the macro was not reset correctly.",
+                    HALUserWarning,
+                )
+                return
 
+            if self.stage_status[stages] != status:
+                self._set_status(stages, status)
+                if output:
+                    self.output_stage_status()
+
+            return
+
+        changed: bool = False
         for stage in stages:
             if stage not in self.stage_status:
                 warnings.warn(
@@ -293,9 +382,12 @@ class Macro:
                 )
                 return
 
-            self.stage_status[stage] = status
+            if self.stage_status[stage] != status:
+                self._set_status(stage, status)
+                changed = True
 
-        if output:
+        # Do not output the same status again if nothing has changed.
+        if output and changed:
             self.output_stage_status()
 
     def output_stage_status(
@@ -307,13 +399,7 @@ class Macro:
 
         out_command = command or self.command
 
-        status_keyw = [self.name]
-        for stage in self.stage_status:
-            status_name = self.stage_status[stage].name
-            assert status_name
-            status_keyw += [stage, status_name.lower()]
-
-        out_command.write(level, stage_status=status_keyw)
+        out_command.write(level, stage_status=self._status_template.copy())
 
     def list_stages(
         self,
@@ -328,14 +414,10 @@ class Macro:
         if only_all is False:
             list_command.write(
                 level,
-                stages=[self.name] + [st for st in flatten(self.stages)],
+                stages=[self.name, *self.flat_stages],
             )
 
-        list_command.write(
-            level,
-            all_stages=[self.name]
-            + [st for st in flatten(self.__STAGES__ + self.__CLEANUP__)],
-        )
+        list_command.write(level, all_stages=[self.name] + self._all_flat_stages)
 
     async def fail_macro(
         self,
@@ -359,12 +441,13 @@ class Macro:
                 stage = [stage]
 
         for ss in stage:
-            if ss in self.__CLEANUP__:
+            if ss in self._cleanup_set:
                 continue
-            if self.stage_status[ss] == StageStatus.ACTIVE:
-                self.stage_status[ss] = StageStatus.FAILED
-            if self.stage_status[ss] == StageStatus.WAITING:
-                self.stage_status[ss] = StageStatus.CANCELLED
+            status = self.stage_status[ss]
+            if status == StageStatus.ACTIVE:
+                self._set_status(ss, StageStatus.FAILED)
+            elif status == StageStatus.WAITING:
+                self._set_status(ss, StageStatus.CANCELLED)
 
         self.output_stage_status()
 
@@ -377,12 +460,7 @@ class Macro:
 
             try:
                 self.set_stage_status(cleanup_stage, StageStatus.ACTIVE)
-                await asyncio.gather(
-                    *[
-                        record_overhead(self)(coro)
-                        for coro in self._get_coros(cleanup_stage)
-                    ]
-                )
+                await self._wrap_overhead(getattr(self, str(cleanup_stage))())
                 self.set_stage_status(cleanup_stage, StageStatus.FINISHED)
             except Exception as err:
                 self.command.error(f"Cleanup {cleanup_stage} failed: {err}")
@@ -418,34 +496,37 @@ class Macro:
 
         self.running = False
 
-        return StageStatus.FAILED not in self.stage_status.values()
-
-    def _get_coros(self, stage: StageType) -> list[Coroutine]:
-        if isinstance(stage, str):
-            stage_method = getattr(self, stage)
+        return self._failed_count == 0
 
-            if not asyncio.iscoroutinefunction(stage_method):
-                raise MacroError(f"Stage function for {stage} is not a coroutine.")
+    async def _wrap_overhead(self, stage_coro: Coroutine[Any, Any, None]):
+        """Runs a macro stage and records its overhead."""
 
-            return [stage_method()]
+        overhead_helper = OverheadHelper(
+            self,
+            stage_coro.__name__,
+            macro_id=self.macro_id,
+        )
+        async with overhead_helper:
+            await stage_coro
 
-        else:
-            coros: list[Coroutine] = []
-            for st in stage:
-                coros += self._get_coros(st)
+    def _get_coros(self, names: tuple[str, ...]) -> list[Coroutine]:
+        """Returns the coroutines for the stage methods in ``names``."""
 
-            return coros
+        # The stage methods are checked to be coroutine functions on reset.
+        return [getattr(self, name)() for name in names]
 
     async def _do_run(self):
         """Actually run the stages."""
 
-        current_task: asyncio.Future | None = None
+        for stage, names, offset in self._stage_plan:
+            coros = self._get_coros(names)
+
+            # Nothing to run (e.g., an empty concurrent stage). Do not gather.
+            if len(coros) == 0:
+                self.set_stage_status(stage, StageStatus.FINISHED)
+                continue
 
-        for istage, stage in enumerate(self.stages):
-            coros = self._get_coros(stage)
-            wrapped_coros = [
-                asyncio.create_task(record_overhead(self)(coro)) for coro in coros
-            ]
+            wrapped_coros = [asyncio.create_task(self._wrap_overhead(c)) for c in coros]
 
             # If we are running multiple stages concurrently, we also record the
             # overhead of the entire set.
@@ -459,7 +540,12 @@ class Macro:
                 )
                 await overhead_helper.start()
 
-            current_task = asyncio.gather(*wrapped_coros)
+            # A single stage is awaited as its own task, without a gather wrapper.
+            current_task: asyncio.Future
+            if len(wrapped_coros) == 1:
+                current_task = wrapped_coros[0]
+            else:
+                current_task = asyncio.gather(*wrapped_coros)
 
             self.set_stage_status(stage, StageStatus.ACTIVE)
 
@@ -483,8 +569,8 @@ class Macro:
                 # Cancel this and all future stages.
                 cancel_stages = [
                     stg
-                    for stg in flatten(self.stages[istage:])
-                    if stg not in self.__CLEANUP__
+                    for stg in self.flat_stages[offset:]
+                    if stg not in self._cleanup_set
                     and self.stage_status[stg] != StageStatus.FINISHED
                 ]
                 self.set_stage_status(
@@ -505,11 +591,12 @@ class Macro:
                     HALUserWarning,
                 )
 
-                # Cancel stage tasks (in case we are running multiple concurrently).
-                with suppress(asyncio.CancelledError):
-                    for task in wrapped_coros:
-                        if not task.done():
-                            task.cancel()
+                # Cancel stage tasks (in case we are running multiple concurrently)
+                # and wait until they are done before failing the macro. Cancelling
+                # a finished task is a no-op.
+                for task in wrapped_coros:
+                    task.cancel()
+                await asyncio.gather(*wrapped_coros, return_exceptions=True)
 
                 await self.fail_macro(err, stage=stage)
                 return
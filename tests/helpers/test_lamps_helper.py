@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_lamps_helper.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest_mock
+
+from hal.helpers.lamps import LampsHelperAPO
+
+
+if TYPE_CHECKING:
+    from hal.actor.actor import HALActor
+
+
+async def test_wait_for_warmup(actor: HALActor, mocker: pytest_mock.MockerFixture):
+    lamps_helper = LampsHelperAPO(actor)
+
+    mocker.patch.object(
+        lamps_helper,
+        "list_status",
+        side_effect=[
+            {"HgCd": (True, True, 2.0, False), "Ne": (True, False, 0.0, False)},
+            {"HgCd": (True, True, 12.0, False), "Ne": (True, True, 6.0, False)},
+        ],
+    )
+    mocker.patch("asyncio.sleep")
+
+    warmup = {"HgCd": 10, "Ne": 5}
+    assert await lamps_helper.wait_for_warmup(["HgCd", "Ne"], 20, warmup=warmup)
+
+
+async def test_wait_for_warmup_timeout(
+    actor: HALActor,
+    mocker: pytest_mock.MockerFixture,
+):
+    lamps_helper = LampsHelperAPO(actor)
+
+    mocker.patch.object(
+        lamps_helper,
+        "list_status",
+        return_value={"HgCd": (True, False, 0.0, False)},
+    )
+
+    assert not await lamps_helper.wait_for_warmup("HgCd", 0.1)
+
+
+async def test_list_status_keyword_cache(actor: HALActor):
+    lamps_helper = LampsHelperAPO(actor)
+
+    lamps_helper._lamp_keys = {"ff": (True, True, time.time() - 200)}
+
+    status = lamps_helper.list_status()
+    assert status["ff"][0] is True
+    assert status["ff"][3] is True
+
+    await lamps_helper._lamp_updated(None)
+
+    assert lamps_helper._lamp_keys is None
+
+
+async def test_turn_lamp_ready_after(
+    actor: HALActor,
+    mocker: pytest_mock.MockerFixture,
+):
+    lamps_helper = LampsHelperAPO(actor)
+
+    mocker.patch.object(
+        lamps_helper,
+        "list_status",
+        return_value={lamp: (True, True, 100.0, True) for lamp in lamps_helper.LAMPS},
+    )
+    sleep_mock = mocker.patch("asyncio.sleep")
+
+    await lamps_helper.turn_lamp(
+        mocker.MagicMock(),
+        "ff",
+        True,
+        delay=10,
+        ready_after=time.monotonic() - 20,
+    )
+
+    assert sleep_mock.call_args_list[0] == mocker.call(0)
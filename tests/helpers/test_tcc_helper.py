@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_tcc_helper.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from hal.actor.actor import HALActor
+
+
+class MockKey:
+    def __init__(self, value):
+        self.value = value
+
+
+async def test_wait_for_axes_status(actor: HALActor, monkeypatch: pytest.MonkeyPatch):
+    tcc_helper = actor.helpers.tcc
+    assert tcc_helper
+
+    monkeypatch.setitem(
+        actor.models["tcc"],
+        "AxisCmdState",
+        MockKey(["Halted", "Halted", "Halted"]),
+    )
+
+    assert await tcc_helper.wait_for_axes_status("Halted", 1)
+
+
+async def test_wait_for_axes_status_timeout(
+    actor: HALActor,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    tcc_helper = actor.helpers.tcc
+    assert tcc_helper
+
+    monkeypatch.setitem(
+        actor.models["tcc"],
+        "AxisCmdState",
+        MockKey(["Halted", "Slewing", "Halted"]),
+    )
+
+    assert not await tcc_helper.wait_for_axes_status("Halted", 0.1)
+
+
+async def test_check_axes_status_axes(actor: HALActor, monkeypatch: pytest.MonkeyPatch):
+    tcc_helper = actor.helpers.tcc
+    assert tcc_helper
+
+    monkeypatch.setitem(
+        actor.models["tcc"],
+        "AxisCmdState",
+        MockKey(["Tracking", "Tracking", "Halted"]),
+    )
+
+    assert not tcc_helper.check_axes_status("Halted")
+    assert tcc_helper.check_axes_status("Halted", axes=("rot",))
+    assert tcc_helper.check_axes_status("tracking", axes=("az", "alt"))
@@ -8,9 +8,15 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from typing import TYPE_CHECKING
 
+import pytest
+
 from hal.exceptions import MacroError
+from hal.macros.macro import Macro as MacroBase
+from hal.macros.macro import StageStatus
 
 
 if TYPE_CHECKING:
@@ -44,3 +50,87 @@ async def test_macro_stage_fails(actor, macro: Macro, mocker):
 
     stage2.assert_called()
     cleanup.assert_called()
+
+
+async def test_macro_run_returns_status(macro: Macro, mocker):
+    assert (await macro.run()) is True
+
+    macro.reset(macro.command)
+    mocker.patch.object(macro, "stage2", side_effect=MacroError)
+
+    assert (await macro.run()) is False
+
+
+async def test_macro_stage_status_output_once(actor, macro: Macro):
+    actor.mock_replies.clear()
+
+    macro.set_stage_status("stage1", StageStatus.ACTIVE)
+    macro.set_stage_status("stage1", StageStatus.ACTIVE)
+    macro.set_stage_status(["stage1"], StageStatus.ACTIVE)
+
+    replies = [reply for reply in actor.mock_replies if "stage_status" in reply]
+    assert len(replies) == 1
+    assert "stage1,active" in replies[0]["stage_status"]
+
+
+def test_macro_bad_stages():
+    with pytest.raises(MacroError, match="Duplicate stages"):
+
+        class DuplicateMacro(MacroBase):
+            name = "duplicate_macro"
+
+            __STAGES__ = ["stage1", "stage1"]
+
+    with pytest.raises(MacroError, match="cannot run in parallel"):
+
+        class ParallelCleanupMacro(MacroBase):
+            name = "parallel_cleanup_macro"
+
+            __STAGES__ = ["stage1"]
+            __CLEANUP__ = [("cleanup1", "cleanup2")]
+
+
+async def test_macro_concurrent_stage_fails(command: HALCommandType):
+    events: list[str] = []
+
+    class ConcurrentMacro(MacroBase):
+        name = "concurrent_macro"
+
+        __STAGES__ = [("stage1", "stage2")]
+        __CLEANUP__ = ["cleanup"]
+
+        async def stage1(self):
+            await asyncio.sleep(0.01)
+            raise MacroError("stage1 failed")
+
+        async def stage2(self):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0.01)
+                events.append("stage2_cancelled")
+                raise
+
+        async def cleanup(self):
+            events.append("cleanup")
+
+    macro = ConcurrentMacro()
+    macro.reset(command)
+
+    assert (await macro.run()) is False
+
+    # The sibling stage is cancelled and awaited before the cleanup runs.
+    assert events == ["stage2_cancelled", "cleanup"]
+    assert macro.stage_status["stage1"] == StageStatus.FAILED
+    assert macro.stage_status["stage2"] == StageStatus.FAILED
+
+
+async def test_macro_empty_stage(macro: Macro, mocker):
+    stage1 = mocker.patch.object(macro, "stage1")
+
+    macro.reset(macro.command, [(), "stage1"], force=True)
+
+    assert (await macro.run()) is True
+
+    stage1.assert_called_once()
+    assert macro.is_stage_done("stage1")